@@ -1,13 +1,50 @@
 import asyncio
+import csv
+import inspect
+import io
 import os
-from mysql.connector import connect, Error
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
+from cachetools import TTLCache
+from mysql.connector import Error, HAVE_CEXT
+from mysql.connector.constants import ClientFlag
+from mysql.connector.errors import PoolError
+from mysql.connector.pooling import CNX_POOL_MAXSIZE, MySQLConnectionPool
 from mcp.server import Server
 from mcp.types import  Tool, TextContent
-from pypinyin import pinyin, Style
-
-
+from pypinyin import lazy_pinyin, Style
+import sqlparse
+from sqlparse.exceptions import SQLParseError
+
+POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "16"))
+FETCH_SIZE = 1024
+KEEPALIVE_SECS = int(os.getenv("MYSQL_KEEPALIVE_SECS", "30"))
+DDL_METHODS = frozenset({"create", "alter", "drop", "rename", "truncate"})
+SCHEMA_CACHE_TTL = int(os.getenv("SCHEMA_CACHE_TTL", "300"))
+MAX_ROWS = int(os.getenv("MAX_ROWS", "10000"))
+LIMIT_SKIP_PATTERN = re.compile(
+    r"\b(limit|into|procedure|for\s+update|for\s+share|lock\s+in\s+share\s+mode)\b", re.IGNORECASE
+)
+REQUIRE_C_EXT = os.getenv("REQUIRE_C_EXT") == "1"
+
+if REQUIRE_C_EXT and not HAVE_CEXT:
+    raise ImportError("REQUIRE_C_EXT=1，但mysql-connector-python的C扩展不可用")
+# 超出范围时MySQLConnectionPool要到首次创建连接池时才抛出AttributeError，在导入时提前报错
+if not 1 <= POOL_SIZE <= CNX_POOL_MAXSIZE:
+    raise ValueError(f"MYSQL_POOL_SIZE必须在1到{CNX_POOL_MAXSIZE}之间，当前为{POOL_SIZE}")
+
+_POOL = None
+_POOL_LOCK = threading.Lock()
+_SCHEMA_CACHE = TTLCache(maxsize=1024, ttl=SCHEMA_CACHE_TTL)
+_SCHEMA_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
 def get_db_config():
-    """从环境变量获取数据库配置信息
+    """从环境变量获取数据库配置信息，结果在首次调用后缓存
 
     返回:
         dict: 包含数据库连接所需的配置信息
@@ -16,6 +53,9 @@ def get_db_config():
         - user: 数据库用户名
         - password: 数据库密码
         - database: 数据库名称
+        - use_pure: C扩展可用时为False，使用C实现解析协议与结果行
+        - autocommit: 每条语句执行后自动提交，连接归还连接池时不会残留未结束的事务
+        - client_flags: 关闭MULTI_STATEMENTS，服务器拒绝在一次execute中执行多条语句
 
     异常:
         ValueError: 当必需的配置信息缺失时抛出
@@ -25,7 +65,10 @@ def get_db_config():
         "port": int(os.getenv("MYSQL_PORT", "3306")),
         "user": os.getenv("MYSQL_USER"),
         "password": os.getenv("MYSQL_PASSWORD"),
-        "database": os.getenv("MYSQL_DATABASE")
+        "database": os.getenv("MYSQL_DATABASE"),
+        "use_pure": not HAVE_CEXT,
+        "autocommit": True,
+        "client_flags": [-ClientFlag.MULTI_STATEMENTS]
     }
 
     if not all([config["user"], config["password"], config["database"]]):
@@ -34,6 +77,65 @@ def get_db_config():
     return config
 
 
+def get_pool() -> MySQLConnectionPool:
+    """获取数据库连接池，首次调用时创建
+
+    连接归还时不重置会话：MySQL 5.6上重置会话需要重新认证，连接开启了autocommit，无需依赖重置结束事务
+
+    返回:
+        MySQLConnectionPool: 以get_db_config()配置创建的连接池，大小由MYSQL_POOL_SIZE指定
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = MySQLConnectionPool(
+                    pool_name="mcp", pool_size=POOL_SIZE, pool_reset_session=False, **get_db_config()
+                )
+    return _POOL
+
+
+@lru_cache(maxsize=8192)
+def get_word_initials(word: str) -> str:
+    """获取单个词的大写拼音首字母，结果按词缓存
+
+    按整词而非单字转换，以保留pypinyin对多音字的词组消歧，例如"银行"为"YH"
+    """
+    # 纯ASCII的词（如user_id）由pypinyin原样返回，直接转大写即可；〇等非ASCII字符仍交给pypinyin转换
+    if word.isascii():
+        return word.upper()
+
+    # 获取每个字的拼音首字母，lazy_pinyin直接返回字符串列表，不为每个字构造候选读音列表
+    word_pinyin = lazy_pinyin(word, style=Style.FIRST_LETTER)
+    # 将每个字的首字母连接起来
+    return ''.join(word_pinyin).upper()
+
+
+def ping_idle_connections():
+    """逐个取出连接池中的空闲连接并ping，已断开的连接会被重新建立"""
+    pool = get_pool()
+    for _ in range(POOL_SIZE):
+        try:
+            conn = pool.get_connection()
+        except PoolError:
+            # 连接池已空，其余连接都在使用中
+            return
+        try:
+            conn.ping(reconnect=True)
+        finally:
+            conn.close()
+
+
+async def keepalive():
+    """每隔MYSQL_KEEPALIVE_SECS秒ping空闲连接，避免连接因wait_timeout被服务器断开后，下一次调用需要重新建连认证"""
+    while True:
+        await asyncio.sleep(KEEPALIVE_SECS)
+        try:
+            await asyncio.to_thread(ping_idle_connections)
+        except (Error, ValueError) as e:
+            print(f"连接保活失败: {e}", file=sys.stderr)
+
+
 def get_chinese_initials(text) -> list[TextContent]:
     """将中文文本转换为拼音首字母
 
@@ -56,16 +158,161 @@ def get_chinese_initials(text) -> list[TextContent]:
     initials = []
 
     for word in words:
-        # 获取每个字的拼音首字母
-        word_pinyin = pinyin(word, style=Style.FIRST_LETTER)
-        # 将每个字的首字母连接起来
-        word_initials = ''.join([p[0].upper() for p in word_pinyin])
-        initials.append(word_initials)
+        initials.append(get_word_initials(word))
 
     # 用逗号连接所有结果
     return [TextContent(type="text", text=','.join(initials))]
 
 
+def strip_comments(query: str) -> str:
+    """按MySQL的注释规则去除SQL文本中的注释（包括MySQL会执行的/*! */注释），字符串中的内容保持原样
+
+    只使用sqlparse的词法分析，不做语法分组，长语句不会超出sqlparse的分组上限
+    sqlparse与MySQL规则不一致之处：
+        - MySQL中#之后直到行尾都是注释，sqlparse在#后无空格时（如#note）不视为注释
+        - MySQL中--之后须跟空白字符才是注释，sqlparse会把--x也视为注释
+    遇到这两种情况时，按MySQL的规则处理，并从其后重新做词法分析
+
+    示例:
+        >>> strip_comments("select * from t #note; update t set a=1")
+        'select * from t '
+        >>> strip_comments("select 1--x;update t set a=1")
+        'select 1- -x;update t set a=1'
+        >>> strip_comments("select 1 /*! ; delete from t */ -- note;\\nfrom dual")
+        'select 1   \\nfrom dual'
+    """
+    kept = []
+    pos = 0
+    while pos < len(query):
+        offset = pos
+        for ttype, value in sqlparse.lexer.tokenize(query[pos:]):
+            if ttype in sqlparse.tokens.Comment and value[:2] == "--" and value[2:3] > " ":
+                # --后不是空白字符，MySQL视为两个减号，中间补一个空格，避免拆分语句时再被sqlparse当作注释
+                kept.append("- -")
+                pos = offset + 2
+                break
+            if ttype in sqlparse.tokens.Comment:
+                kept.append("\n" if value.endswith("\n") else " ")
+            elif "#" in value and value[:1] not in "'\"`":
+                # 字符串与带引号的标识符之外的#，其后直到行尾都是注释
+                cut = offset + value.index("#")
+                kept.append(query[offset:cut])
+                newline = query.find("\n", cut)
+                pos = len(query) if newline < 0 else newline
+                break
+            else:
+                kept.append(value)
+            offset += len(value)
+        else:
+            break
+    return "".join(kept)
+
+
+def split_statements(query: str) -> list[str]:
+    """将SQL文本按分号拆分为单条语句，去除空语句
+
+    先去除注释再拆分，字符串中的分号不会被当作语句分隔符
+    """
+    query = strip_comments(query)
+    statements = (stmt.strip().rstrip(';').rstrip() for stmt in sqlparse.split(query))
+    return [stmt for stmt in statements if stmt]
+
+
+def statement_verb(statement: str) -> str:
+    """获取语句的首个关键字（小写），WITH开头的CTE语句返回其实际类型，如select"""
+    verb = statement.split(None, 1)[0].lower()
+    if verb == "with":
+        verb = sqlparse.parse(statement)[0].get_type().lower()
+    return verb
+
+
+def top_level_keywords(statement: str) -> str:
+    """返回语句中括号之外的关键字（小写，以空格连接），字符串、带引号的标识符与子查询中的内容不计入"""
+    keywords = []
+    depth = 0
+    # 只做词法分析不做语法分组，长语句也不会超出sqlparse的分组上限
+    for ttype, value in sqlparse.lexer.tokenize(statement):
+        if ttype in sqlparse.tokens.Punctuation:
+            depth += (value == "(") - (value == ")")
+        elif depth == 0 and ttype in sqlparse.tokens.Keyword:
+            keywords.append(value.lower())
+    return " ".join(keywords)
+
+
+def apply_row_limit(statement: str) -> str:
+    """为未指定LIMIT的SELECT语句追加LIMIT，避免一次拉取过多数据，MAX_ROWS为0时不限制
+
+    多取一行(MAX_ROWS + 1)，用于判断结果是否被截断
+    顶层带有LIMIT、INTO、PROCEDURE、FOR UPDATE等子句的语句追加LIMIT会改变语义或产生语法错误，保持原样
+    """
+    if (MAX_ROWS <= 0 or statement_verb(statement) != "select"
+            or LIMIT_SKIP_PATTERN.search(top_level_keywords(statement))):
+        return statement
+    # 换行后再追加，避免被语句末尾的单行注释吞掉
+    return f"{statement}\nLIMIT {MAX_ROWS + 1}"
+
+
+def run_statement(conn, cursor, statement: str, out: io.StringIO):
+    """在给定连接上执行单条SQL语句，将格式化后的结果文本写入out
+
+    异常:
+        Error: 当语句执行失败时抛出
+    """
+    limited = apply_row_limit(statement)
+    cursor.execute(limited)
+    # DDL语句可能改变表结构，需清空表结构缓存
+    if statement_verb(statement) in DDL_METHODS:
+        clear_schema_cache()
+    if write_result(conn, cursor, out, MAX_ROWS if limited != statement else None):
+        out.write(f"\n(结果已截断为前{MAX_ROWS}行)")
+
+
+def write_result(conn, cursor, out: io.StringIO, max_rows: int = None) -> bool:
+    """将游标上刚执行完的语句结果格式化后写入out
+
+    游标需以raw=True创建：跳过驱动逐值的类型转换，直接解码服务器返回的文本
+
+    参数:
+        max_rows (int): 最多写入的行数，为None时不限制
+
+    返回:
+        bool: 结果集超过max_rows行而被截断时为True
+    """
+    # 检查语句是否返回了结果集 (SELECT, SHOW, EXPLAIN, etc.)
+    if cursor.description:
+        columns = [desc[0] for desc in cursor.description]
+        charset = conn.python_charset
+
+        # 将列名和数据合并为CSV格式，分批读取结果集，避免整个结果集同时驻留内存
+        writer = csv.writer(out, lineterminator="\n")
+        writer.writerow(columns)
+        written = 0
+        truncated = False
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            # 超出部分的行仍需读完，否则连接上会残留未读取的结果
+            if max_rows is not None and written + len(rows) > max_rows:
+                rows = rows[:max_rows - written]
+                truncated = True
+            written += len(rows)
+            # 特殊处理None值，其余数据按连接字符集解码
+            writer.writerows([
+                ["NULL" if value is None else value.decode(charset, "replace") for value in row]
+                for row in rows
+            ])
+
+        # 去掉末尾的换行符
+        out.seek(out.tell() - 1)
+        out.truncate()
+        return truncated
+
+    # 如果语句没有返回结果集 (INSERT, UPDATE, DELETE, etc.)，连接开启了autocommit，执行后即已提交
+    out.write(f"查询执行成功。影响行数: {cursor.rowcount}")
+    return False
+
+
 def execute_sql(query: str) -> list[TextContent]:
     """执行SQL查询语句
 
@@ -74,55 +321,126 @@ def execute_sql(query: str) -> list[TextContent]:
 
     返回:
         list[TextContent]: 包含查询结果的TextContent列表
-        - 对于SELECT查询：返回CSV格式的结果，包含列名和数据
+        - 对于SELECT查询：返回CSV格式的结果，包含列名和数据，未指定LIMIT时最多返回MAX_ROWS行，超出时在末尾注明已截断
         - 对于SHOW TABLES：返回数据库中的所有表名
         - 对于其他查询：返回执行状态和影响行数
         - 多条语句的结果以"---"分隔
+        - 多条语句在同一个连接上按顺序执行，FOUND_ROWS()、SHOW WARNINGS、用户变量等依赖会话状态的语句可正常使用
 
     异常:
         Error: 当数据库连接或查询执行失败时抛出
     """
-    config = get_db_config()
     try:
-        with connect(**config) as conn:
-            with conn.cursor() as cursor:
-                statements = [stmt.strip() for stmt in query.split(';') if stmt.strip()]
-                results = []
-
-                for statement in statements:
+        with get_pool().get_connection() as conn:
+            with conn.cursor(raw=True, buffered=False) as cursor:
+                # 所有语句的结果直接写入同一个缓冲区，不再保留中间结果列表
+                out = io.StringIO()
+
+                for index, statement in enumerate(split_statements(query)):
+                    if index:
+                        out.write("\n---\n")
+                    start = out.tell()
                     try:
-                        cursor.execute(statement)
-
-                        # 检查语句是否返回了结果集 (SELECT, SHOW, EXPLAIN, etc.)
-                        if cursor.description:
-                            columns = [desc[0] for desc in cursor.description]
-                            rows = cursor.fetchall()
-
-                            # 将每一行的数据转换为字符串，特殊处理None值
-                            formatted_rows = []
-                            for row in rows:
-                                formatted_row = ["NULL" if value is None else str(value) for value in row]
-                                formatted_rows.append(",".join(formatted_row))
-
-                            # 将列名和数据合并为CSV格式
-                            results.append("\n".join([",".join(columns)] + formatted_rows))
-
-                        # 如果语句没有返回结果集 (INSERT, UPDATE, DELETE, etc.)
-                        else:
-                            conn.commit()  # 只有在非查询语句时才提交
-                            results.append(f"查询执行成功。影响行数: {cursor.rowcount}")
-
-                    except Error as stmt_error:
-                        # 单条语句执行出错时，记录错误并继续执行
-                        results.append(f"执行语句 '{statement}' 出错: {str(stmt_error)}")
+                        run_statement(conn, cursor, statement, out)
+                    except (Error, SQLParseError) as stmt_error:
+                        # 单条语句执行出错时，丢弃已写入的部分结果，记录错误并继续执行
+                        out.seek(start)
+                        out.truncate()
+                        out.write(f"执行语句 '{statement}' 出错: {str(stmt_error)}")
                         # 可以在这里选择是否继续执行后续语句，目前是继续
 
-                return [TextContent(type="text", text="\n---\n".join(results))]
+                return [TextContent(type="text", text=out.getvalue())]
 
     except Error as e:
         print(f"执行SQL '{query}' 时出错: {e}")
         return [TextContent(type="text", text=f"执行查询时出错: {str(e)}")]
 
+
+def execute_sql_params(sql: str, params: tuple) -> list[TextContent]:
+    """执行内部使用的参数化SQL语句，参数由驱动转义后绑定
+
+    参数:
+        sql (str): 单条SQL语句，使用%s作为参数占位符
+        params (tuple): 与占位符一一对应的参数
+
+    返回:
+        list[TextContent]: 与execute_sql相同格式的结果
+
+    异常:
+        Error: 当数据库连接或查询执行失败时抛出
+    """
+    with get_pool().get_connection() as conn:
+        with conn.cursor(raw=True, buffered=False) as cursor:
+            out = io.StringIO()
+            cursor.execute(sql, params)
+            write_result(conn, cursor, out)
+            return [TextContent(type="text", text=out.getvalue())]
+
+
+def split_table_names(text: str) -> list[str]:
+    """将以逗号分隔的表名拆分为列表"""
+    return [name.strip() for name in text.split(',') if name.strip()]
+
+
+def schema_cache(normalize=None):
+    """按(函数名, 规范化后的参数)缓存表结构查询结果，有效期为SCHEMA_CACHE_TTL秒
+
+    参数:
+        normalize (callable): 将调用参数转换为缓存键，使等价的输入命中同一缓存；
+            只能合并查询结果完全相同的输入，为None时直接以原始参数为键
+
+    说明:
+        - 通过execute_sql执行的DDL语句会自动清空缓存
+        - 在其他客户端修改表结构后，可调用被装饰函数的cache_clear()或clear_schema_cache()手动清除
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(text):
+            key = (func.__name__, normalize(text) if normalize else text)
+            with _SCHEMA_CACHE_LOCK:
+                result = _SCHEMA_CACHE.get(key)
+            if result is None:
+                result = func(text)
+                with _SCHEMA_CACHE_LOCK:
+                    _SCHEMA_CACHE[key] = result
+            return list(result)
+
+        def cache_clear():
+            with _SCHEMA_CACHE_LOCK:
+                for key in [key for key in _SCHEMA_CACHE.keys() if key[0] == func.__name__]:
+                    _SCHEMA_CACHE.pop(key, None)
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def clear_schema_cache():
+    """清空所有表结构查询缓存"""
+    with _SCHEMA_CACHE_LOCK:
+        _SCHEMA_CACHE.clear()
+
+
+def build_table_query(template: str, text: str) -> tuple[str, tuple]:
+    """按表名列表生成IN条件的占位符，返回填充后的SQL语句与参数
+
+    参数:
+        template (str): 包含{placeholders}的SQL模板，第一个参数为库名
+        text (str): 要查询的表名，多个表名以逗号分隔
+    """
+    table_names = split_table_names(text)
+    if not table_names:
+        raise ValueError("缺少表信息")
+    placeholders = ",".join(["%s"] * len(table_names))
+    return template.format(placeholders=placeholders), (get_db_config()['database'], *table_names)
+
+
+def normalize_table_names(text: str) -> tuple[str, ...]:
+    """将表名列表规范化为去重排序后的元组，结果按表名排序，因此顺序不影响查询结果"""
+    return tuple(sorted(set(split_table_names(text))))
+
+
+@schema_cache()
 def get_table_name(text : str) -> list[TextContent]:
     """根据表的中文注释搜索数据库中的表名
 
@@ -135,12 +453,35 @@ def get_table_name(text : str) -> list[TextContent]:
         - 结果以CSV格式返回，包含列名和数据
     """
     config = get_db_config()
-    sql = "SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_COMMENT "
-    sql += f"FROM information_schema.TABLES WHERE TABLE_SCHEMA = '{config['database']}' AND TABLE_COMMENT LIKE '%{text}%';"
-    return execute_sql(sql)
+    sql = ("SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_COMMENT FROM information_schema.TABLES "
+           "WHERE TABLE_SCHEMA = %s AND TABLE_COMMENT LIKE %s")
+    return execute_sql_params(sql, (config['database'], f"%{text}%"))
+
+
+_TABLE_DESC_SQL = (
+    "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_COMMENT FROM information_schema.COLUMNS "
+    "WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) "
+    "ORDER BY TABLE_NAME, ORDINAL_POSITION"
+)
 
+_TABLE_INDEX_SQL = (
+    "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, SEQ_IN_INDEX, NON_UNIQUE, INDEX_TYPE "
+    "FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = %s AND TABLE_NAME IN ({placeholders}) "
+    "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX"
+)
+
+_TABLE_INFO_SQL = (
+    "SELECT c.TABLE_NAME, c.COLUMN_NAME, c.COLUMN_COMMENT, s.INDEX_NAME, s.SEQ_IN_INDEX, s.NON_UNIQUE, s.INDEX_TYPE "
+    "FROM information_schema.COLUMNS c LEFT JOIN information_schema.STATISTICS s "
+    "ON c.TABLE_SCHEMA = s.TABLE_SCHEMA AND c.TABLE_NAME = s.TABLE_NAME AND c.COLUMN_NAME = s.COLUMN_NAME "
+    "WHERE c.TABLE_SCHEMA = %s AND c.TABLE_NAME IN ({placeholders}) "
+    "ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION, s.INDEX_NAME, s.SEQ_IN_INDEX"
+)
+
+
+@schema_cache(normalize=normalize_table_names)
 def get_table_desc(text : str) -> list[TextContent]:
-    """获取指定表的字段结构信息
+    """获取指定表的字段结构信息，已不推荐使用，请使用get_table_info
 
     参数:
         text (str): 要查询的表名，多个表名以逗号分隔
@@ -151,18 +492,11 @@ def get_table_desc(text : str) -> list[TextContent]:
         - 结果按表名和字段顺序排序
         - 结果以CSV格式返回，包含列名和数据
     """
-    config = get_db_config()
-    # 将输入的表名按逗号分割成列表
-    table_names = [name.strip() for name in text.split(',')]
-    # 构建IN条件
-    table_condition = "','".join(table_names)
-    sql = "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_COMMENT "
-    sql += f"FROM information_schema.COLUMNS WHERE TABLE_SCHEMA = '{config['database']}' "
-    sql += f"AND TABLE_NAME IN ('{table_condition}') ORDER BY TABLE_NAME, ORDINAL_POSITION;"
-    return execute_sql(sql)
+    return execute_sql_params(*build_table_query(_TABLE_DESC_SQL, text))
 
+@schema_cache(normalize=normalize_table_names)
 def get_table_index(text : str) -> list[TextContent]:
-    """获取指定表的索引信息
+    """获取指定表的索引信息，已不推荐使用，请使用get_table_info
 
     参数:
         text (str): 要查询的表名，多个表名以逗号分隔
@@ -173,42 +507,153 @@ def get_table_index(text : str) -> list[TextContent]:
         - 结果按表名、索引名和索引顺序排序
         - 结果以CSV格式返回，包含列名和数据
     """
-    config = get_db_config()
-    # 将输入的表名按逗号分割成列表
-    table_names = [name.strip() for name in text.split(',')]
-    # 构建IN条件
-    table_condition = "','".join(table_names)
-    sql = "SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME, SEQ_IN_INDEX, NON_UNIQUE, INDEX_TYPE "
-    sql += f"FROM information_schema.STATISTICS WHERE TABLE_SCHEMA = '{config['database']}' "
-    sql += f"AND TABLE_NAME IN ('{table_condition}') ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX;"
-    return execute_sql(sql)
+    return execute_sql_params(*build_table_query(_TABLE_INDEX_SQL, text))
+
+@schema_cache(normalize=normalize_table_names)
+def get_table_info(text : str) -> list[TextContent]:
+    """通过一次JOIN查询获取指定表的字段结构与索引信息
+
+    参数:
+        text (str): 要查询的表名，多个表名以逗号分隔
+
+    返回:
+        list[TextContent]: 包含查询结果的TextContent列表
+        - 每行为一个字段，附带其所在索引的索引名、索引顺序、是否唯一、索引类型
+        - 字段属于多个索引时每个索引一行，不属于任何索引时索引信息为NULL
+        - 结果按表名、字段顺序、索引名和索引顺序排序
+        - 结果以CSV格式返回，包含列名和数据
+    """
+    return execute_sql_params(*build_table_query(_TABLE_INFO_SQL, text))
+
+
+_LOCK_TABLES_SQL = (
+    "SELECT p2.`HOST` 被阻塞方host,  p2.`USER` 被阻塞方用户, r.trx_id 被阻塞方事务id, "
+    "r.trx_mysql_thread_id 被阻塞方线程号,TIMESTAMPDIFF(SECOND, r.trx_wait_started, CURRENT_TIMESTAMP) 等待时间, "
+    "r.trx_query 被阻塞的查询, l.lock_table 阻塞方锁住的表, m.`lock_mode` 被阻塞方的锁模式, "
+    "m.`lock_type` '被阻塞方的锁类型(表锁还是行锁)', m.`lock_index` 被阻塞方锁住的索引, "
+    "m.`lock_space` 被阻塞方锁对象的space_id, m.lock_page 被阻塞方事务锁定页的数量, "
+    "m.lock_rec 被阻塞方事务锁定记录的数量, m.lock_data 被阻塞方事务锁定记录的主键值, "
+    "p.`HOST` 阻塞方主机, p.`USER` 阻塞方用户, b.trx_id 阻塞方事务id,b.trx_mysql_thread_id 阻塞方线程号, "
+    "b.trx_query 阻塞方查询, l.`lock_mode` 阻塞方的锁模式, l.`lock_type` '阻塞方的锁类型(表锁还是行锁)',"
+    "l.`lock_index` 阻塞方锁住的索引,l.`lock_space` 阻塞方锁对象的space_id,l.lock_page 阻塞方事务锁定页的数量,"
+    "l.lock_rec 阻塞方事务锁定行的数量,  l.lock_data 阻塞方事务锁定记录的主键值,"
+    "IF(p.COMMAND = 'Sleep', CONCAT(p.TIME, ' 秒'), 0) 阻塞方事务空闲的时间 "
+    "FROM information_schema.INNODB_LOCK_WAITS w "
+    "INNER JOIN information_schema.INNODB_TRX b ON b.trx_id = w.blocking_trx_id "
+    "INNER JOIN information_schema.INNODB_TRX r ON r.trx_id = w.requesting_trx_id "
+    "INNER JOIN information_schema.INNODB_LOCKS l ON w.blocking_lock_id = l.lock_id AND l.`lock_trx_id` = b.`trx_id` "
+    "INNER JOIN information_schema.INNODB_LOCKS m ON m.`lock_id` = w.`requested_lock_id` AND m.`lock_trx_id` = r.`trx_id` "
+    "INNER JOIN information_schema.PROCESSLIST p ON p.ID = b.trx_mysql_thread_id "
+    "INNER JOIN information_schema.PROCESSLIST p2 ON p2.ID = r.trx_mysql_thread_id "
+    "ORDER BY 等待时间 DESC;"
+)
+
 
 def get_lock_tables() -> list[TextContent]:
-    sql = "SELECT p2.`HOST` 被阻塞方host,  p2.`USER` 被阻塞方用户, r.trx_id 被阻塞方事务id, "
-    sql += "r.trx_mysql_thread_id 被阻塞方线程号,TIMESTAMPDIFF(SECOND, r.trx_wait_started, CURRENT_TIMESTAMP) 等待时间, "
-    sql += "r.trx_query 被阻塞的查询, l.lock_table 阻塞方锁住的表, m.`lock_mode` 被阻塞方的锁模式, "
-    sql += "m.`lock_type` '被阻塞方的锁类型(表锁还是行锁)', m.`lock_index` 被阻塞方锁住的索引, "
-    sql += "m.`lock_space` 被阻塞方锁对象的space_id, m.lock_page 被阻塞方事务锁定页的数量, "
-    sql += "m.lock_rec 被阻塞方事务锁定记录的数量, m.lock_data 被阻塞方事务锁定记录的主键值, "
-    sql += "p.`HOST` 阻塞方主机, p.`USER` 阻塞方用户, b.trx_id 阻塞方事务id,b.trx_mysql_thread_id 阻塞方线程号, "
-    sql += "b.trx_query 阻塞方查询, l.`lock_mode` 阻塞方的锁模式, l.`lock_type` '阻塞方的锁类型(表锁还是行锁)',"
-    sql += "l.`lock_index` 阻塞方锁住的索引,l.`lock_space` 阻塞方锁对象的space_id,l.lock_page 阻塞方事务锁定页的数量,"
-    sql += "l.lock_rec 阻塞方事务锁定行的数量,  l.lock_data 阻塞方事务锁定记录的主键值,"
-    sql += "IF(p.COMMAND = 'Sleep', CONCAT(p.TIME, ' 秒'), 0) 阻塞方事务空闲的时间 "
-    sql += "FROM information_schema.INNODB_LOCK_WAITS w "
-    sql += "INNER JOIN information_schema.INNODB_TRX b ON b.trx_id = w.blocking_trx_id "
-    sql += "INNER JOIN information_schema.INNODB_TRX r ON r.trx_id = w.requesting_trx_id "
-    sql += "INNER JOIN information_schema.INNODB_LOCKS l ON w.blocking_lock_id = l.lock_id AND l.`lock_trx_id` = b.`trx_id` "
-    sql += "INNER JOIN information_schema.INNODB_LOCKS m ON m.`lock_id` = w.`requested_lock_id` AND m.`lock_trx_id` = r.`trx_id` "
-    sql += "INNER JOIN information_schema.PROCESSLIST p ON p.ID = b.trx_mysql_thread_id "
-    sql += "INNER JOIN information_schema.PROCESSLIST p2 ON p2.ID = r.trx_mysql_thread_id "
-    sql += "ORDER BY 等待时间 DESC;"
-
-    return execute_sql(sql)
+    return execute_sql(_LOCK_TABLES_SQL)
 
 # 初始化服务器
 app = Server("operateMysql")
 
+# 工具列表在导入时构建一次，list_tools直接返回副本
+_TOOLS: list[Tool] = [
+    Tool(
+        name="execute_sql",
+        description="在MySQL5.6s数据库上执行SQL",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "要执行的SQL语句"
+                }
+            },
+            "required": ["query"]
+        }
+    ),
+    Tool(
+        name="get_chinese_initials",
+        description="创建表结构时，将中文字段名转换为拼音首字母字段",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要获取拼音首字母的汉字文本，以“,”分隔"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_table_name",
+        description="根据表中文名搜索数据库中对应的表名",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要搜索的表中文名"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_table_desc",
+        description="根据表名搜索数据库中对应的表结构,支持多表查询,已不推荐使用,请使用get_table_info",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要搜索的表名"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_table_index",
+        description="根据表名搜索数据库中对应的表索引,支持多表查询,已不推荐使用,请使用get_table_info",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要搜索的表名"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_table_info",
+        description="根据表名一次获取数据库中对应的表结构与表索引,每个字段附带其所在的索引,支持多表查询",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "text": {
+                    "type": "string",
+                    "description": "要搜索的表名"
+                }
+            },
+            "required": ["text"]
+        }
+    ),
+    Tool(
+        name="get_lock_tables",
+        description="获取当前mysql服务器InnoDB 的行级锁",
+        inputSchema={
+            "type": "object",
+            "properties": {
+
+            }
+        }
+    ),
+]
+
+
 @app.list_tools()
 async def list_tools() -> list[Tool]:
     """列出可用的MySQL工具
@@ -216,121 +661,45 @@ async def list_tools() -> list[Tool]:
     返回:
         list[Tool]: 工具列表，当前仅包含execute_sql工具
     """
-    return [
-        Tool(
-            name="execute_sql",
-            description="在MySQL5.6s数据库上执行SQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "要执行的SQL语句"
-                    }
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="get_chinese_initials",
-            description="创建表结构时，将中文字段名转换为拼音首字母字段",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要获取拼音首字母的汉字文本，以“,”分隔"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="get_table_name",
-            description="根据表中文名搜索数据库中对应的表名",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要搜索的表中文名"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="get_table_desc",
-            description="根据表名搜索数据库中对应的表结构,支持多表查询",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要搜索的表名"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="get_table_index",
-            description="根据表名搜索数据库中对应的表索引,支持多表查询",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "text": {
-                        "type": "string",
-                        "description": "要搜索的表名"
-                    }
-                },
-                "required": ["text"]
-            }
-        ),
-        Tool(
-            name="get_lock_tables",
-            description="获取当前mysql服务器InnoDB 的行级锁",
-            inputSchema={
-                "type": "object",
-                "properties": {
+    return list(_TOOLS)
+
+# 工具名 -> (必填参数名, 缺少参数时的提示, 处理函数)，参数名为None表示无需参数
+_DISPATCH = {
+    "execute_sql": ("query", "缺少查询语句", execute_sql),
+    "get_chinese_initials": ("text", "缺少文本", get_chinese_initials),
+    "get_table_name": ("text", "缺少表信息", get_table_name),
+    "get_table_desc": ("text", "缺少表信息", get_table_desc),
+    "get_table_index": ("text", "缺少表信息", get_table_index),
+    "get_table_info": ("text", "缺少表信息", get_table_info),
+    "get_lock_tables": (None, None, get_lock_tables),
+}
 
-                }
-            }
-        ),
-    ]
 
 @app.call_tool()
 async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    spec = _DISPATCH.get(name)
+    if spec is None:
+        raise ValueError(f"未知的工具: {name}")
+
+    arg_name, missing_msg, handler = spec
+    args = ()
+    if arg_name:
+        value = arguments.get(arg_name)
+        if not value:
+            raise ValueError(missing_msg)
+        args = (value,)
+
+    if inspect.iscoroutinefunction(handler):
+        return await handler(*args)
+    # 同步的数据库操作放到线程池中执行，避免阻塞事件循环
+    return await asyncio.to_thread(handler, *args)
+
 
-    if name == "execute_sql":
-        query = arguments.get("query")
-        if not query:
-            raise ValueError("缺少查询语句")
-        return execute_sql(query)
-    elif name == "get_chinese_initials":
-        text = arguments.get("text")
-        if not text:
-            raise ValueError("缺少文本")
-        return get_chinese_initials(text)
-    elif name == "get_table_name":
-        text = arguments.get("text")
-        if not text:
-            raise ValueError("缺少表信息")
-        return get_table_name(text)
-    elif name == "get_table_desc":
-        text = arguments.get("text")
-        if not text:
-            raise ValueError("缺少表信息")
-        return get_table_desc(text)
-    elif name == "get_table_index":
-        text = arguments.get("text")
-        if not text:
-            raise ValueError("缺少表信息")
-        return get_table_index(text)
-    elif name == "get_lock_tables":
-        return get_lock_tables()
-
-    raise ValueError(f"未知的工具: {name}")
+def configure_executor():
+    """将当前事件循环的默认线程池大小设为连接池大小，使并发的数据库操作不会耗尽连接池"""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=POOL_SIZE, thread_name_prefix="mysql")
+    )
 
 
 async def main():
@@ -342,6 +711,9 @@ async def main():
     """
     from mcp.server.stdio import stdio_server
 
+    configure_executor()
+    # 保留任务引用，避免保活任务被垃圾回收
+    keepalive_task = asyncio.create_task(keepalive()) if KEEPALIVE_SECS > 0 else None
     async with stdio_server() as (read_stream, write_stream):
         try:
             await app.run(